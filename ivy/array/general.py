@@ -987,8 +987,11 @@ class ArrayWithGeneral(abc.ABC):
         return ivy.scatter_flat(self, updates, size=size, reduction=reduction, out=out)
 
     def indices_where(
-        self: ivy.Array, *, out: Optional[Union[ivy.Array, ivy.NativeArray]] = None
-    ) -> Union[ivy.Array, ivy.NativeArray]:
+        self: ivy.Array,
+        *,
+        as_tuple: bool = False,
+        out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    ) -> Union[ivy.Array, ivy.NativeArray, Tuple[ivy.Array]]:
         """
         ivy.Array instance method variant of ivy.indices_where. This method simply
         wraps the function, and so the docstring for ivy.indices_where also applies
@@ -998,6 +1001,9 @@ class ArrayWithGeneral(abc.ABC):
         ----------
         self
             input array for which indices are desired
+        as_tuple
+            Whether to return a tuple with one index array per dimension, rather
+            than a single stacked array. Default is False.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -1008,12 +1014,13 @@ class ArrayWithGeneral(abc.ABC):
             Indices for where the boolean array is True.
 
         """
-        return ivy.indices_where(self, out=out)
+        return ivy.indices_where(self, as_tuple=as_tuple, out=out)
 
     def one_hot(
         self: ivy.Array,
         depth: int,
         *,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
         device: Union[ivy.Device, ivy.NativeDevice] = None,
         out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     ) -> Union[ivy.Array, ivy.NativeArray]:
@@ -1028,6 +1035,9 @@ class ArrayWithGeneral(abc.ABC):
             input array containing the indices for which the ones should be scattered
         depth
             Scalar defining the depth of the one-hot dimension.
+        dtype
+            data type of the output array. If None, the default one-hot data type
+            of the backend is used. Default is None.
         device
             device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc.
             Same as x if None.
@@ -1042,7 +1052,7 @@ class ArrayWithGeneral(abc.ABC):
             which overrides.
 
         """
-        return ivy.one_hot(self, depth, device=device, out=out)
+        return ivy.one_hot(self, depth, dtype=dtype, device=device, out=out)
 
     def get_num_dims(self: ivy.Array, as_array: bool = False) -> int:
         """
@@ -7,15 +7,16 @@ import jax.numpy as jnp
 import jaxlib
 from numbers import Number
 from operator import mul
-from functools import reduce
+from itertools import accumulate
 from jaxlib.xla_extension import Buffer
-from typing import Iterable, Optional, Union, Sequence, List
+from typing import Iterable, Optional, Union, Sequence, List, Tuple
 import multiprocessing as _multiprocessing
 from haiku._src.data_structures import FlatMapping
 
 # local
 import ivy
 from ivy.functional.backends.jax.device import _to_device, _to_array
+from ivy.functional.backends.jax.data_type import as_native_dtype
 from ivy.functional.backends.jax import JaxArray
 
 
@@ -303,11 +304,9 @@ def gather_nd(
     indices_shape = indices.shape
     params_shape = params.shape
     num_index_dims = indices_shape[-1]
-    res_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
+    res_dim_sizes_list = list(accumulate(params_shape[:0:-1], mul, initial=1))[::-1]
     result_dim_sizes = jnp.array(res_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
+    implicit_indices_factor = res_dim_sizes_list[num_index_dims - 1]
     flat_params = jnp.reshape(params, (-1,))
     new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
     indices_scales = jnp.reshape(result_dim_sizes[0:num_index_dims], new_shape)
@@ -335,15 +334,24 @@ def multiprocessing(context=None):
 
 # noinspection PyUnusedLocal
 def one_hot(
-    indices: JaxArray, depth: int, *, device, out: Optional[JaxArray] = None
+    indices: JaxArray,
+    depth: int,
+    *,
+    dtype: Optional[jnp.dtype] = None,
+    device,
+    out: Optional[JaxArray] = None,
 ) -> JaxArray:
     # from https://stackoverflow.com/questions/38592324/one-hot-encoding-using-numpy
-    res = jnp.eye(depth)[jnp.array(indices).reshape(-1)]
+    res = jnp.eye(depth, dtype=as_native_dtype(dtype))[jnp.array(indices).reshape(-1)]
     return _to_device(res.reshape(list(indices.shape) + [depth]), device)
 
 
-def indices_where(x: JaxArray) -> JaxArray:
+def indices_where(
+    x: JaxArray, *, as_tuple: bool = False
+) -> Union[JaxArray, Tuple[JaxArray]]:
     where_x = jnp.where(x)
+    if as_tuple:
+        return where_x
     ret = jnp.concatenate([jnp.expand_dims(item, -1) for item in where_x], -1)
     return ret
 
@@ -11,6 +11,7 @@ import multiprocessing as _multiprocessing
 # local
 from ivy.functional.ivy.device import default_device
 from ivy.functional.backends.mxnet.device import dev
+from ivy.functional.backends.mxnet.data_type import as_native_dtype
 from ivy.functional.backends.mxnet import (
     _handle_flat_arrays_in_out,
     _mxnet_init_context,
@@ -262,8 +263,20 @@ def multiprocessing(context=None):
     )
 
 
-def one_hot(indices: mx.nd.NDArray, depth: int, *, device: mx.context.Context):
-    return mx.nd.one_hot(indices, depth)
+def one_hot(
+    indices: mx.nd.NDArray,
+    depth: int,
+    *,
+    dtype: Optional[type] = None,
+    device: mx.context.Context,
+):
+    if dtype is None:
+        return mx.nd.one_hot(indices, depth)
+    dtype = as_native_dtype(dtype)
+    if dtype == np.bool_:
+        # mx.nd.one_hot does not accept a boolean output dtype
+        return mx.nd.one_hot(indices, depth, dtype="uint8").astype(dtype)
+    return mx.nd.one_hot(indices, depth, dtype=dtype)
 
 
 def shape(
@@ -283,7 +296,7 @@ def get_num_dims(x, as_tensor=False):
     )
 
 
-def indices_where(x):
+def indices_where(x, *, as_tuple=False):
     x_shape = x.shape
     x_flat = x.reshape(
         (
@@ -293,8 +306,12 @@ def indices_where(x):
     )
     flat_indices = x_flat.astype("int32").tostype("csr").indices
     if flat_indices.shape == (0,):
+        if as_tuple:
+            return tuple(flat_indices for _ in x_shape)
         res = flat_indices.reshape((0, len(x_shape)))
         return res
+    if as_tuple:
+        return tuple(mx.nd.unravel_index(flat_indices, x_shape))
     res = mx.nd.swapaxes(mx.nd.unravel_index(flat_indices, x_shape), 0, 1)
     return res
 
@@ -1,34 +1,47 @@
 """Collection of Numpy general functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-from typing import Optional, Union, Sequence, List
+from typing import Optional, Union, Sequence, List, Tuple
 import numpy as np
-from operator import mul
-from functools import reduce
 import multiprocessing as _multiprocessing
 from numbers import Number
 
 # local
 import ivy
 from ivy.functional.backends.numpy.device import _to_device
+from ivy.functional.backends.numpy.data_type import as_native_dtype
 
 # Helpers #
 # --------#
 
 
 def copy_array(x: np.ndarray, *, out: Optional[np.ndarray] = None) -> np.ndarray:
-    return x.copy()
+    if out is None:
+        return x.copy()
+    if out.dtype != x.dtype:
+        # np.copyto only casts between same kind dtypes
+        return ivy.inplace_update(out, x.copy())
+    np.copyto(out, x)
+    return out
+
+
+copy_array.support_native_out = True
 
 
 def array_equal(x0: np.ndarray, x1: np.ndarray) -> bool:
-    return np.array_equal(x0, x1)
+    if not (isinstance(x0, np.ndarray) and isinstance(x1, np.ndarray)):
+        # python scalars and lists are passed through unconverted
+        return np.array_equal(x0, x1)
+    if x0.shape != x1.shape:
+        return False
+    if x0 is x1 and x0.dtype.kind not in "fc":
+        # only nan compares unequal to itself
+        return True
+    return bool((x0 == x1).all())
 
 
 def to_numpy(x: np.ndarray, copy: bool = True) -> np.ndarray:
-    if copy:
-        return x.copy()
-    else:
-        return x
+    return np.array(x, copy=True) if copy else np.asarray(x)
 
 
 def to_scalar(x: np.ndarray) -> Number:
@@ -57,13 +70,6 @@ def inplace_update(
 ) -> ivy.Array:
     if ivy.is_array(x) and ivy.is_array(val):
         (x_native, val_native), _ = ivy.args_to_native(x, val)
-
-        # make both arrays contiguous if not already
-        if not x_native.flags.c_contiguous:
-            x_native = np.ascontiguousarray(x_native)
-        if not val_native.flags.c_contiguous:
-            val_native = np.ascontiguousarray(val_native)
-
         if val_native.shape == x_native.shape:
             if x_native.dtype != val_native.dtype:
                 x_native = x_native.astype(val_native.dtype)
@@ -88,24 +94,26 @@ def is_native_array(x, exclusive=False):
 def floormod(
     x: np.ndarray, y: np.ndarray, *, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    ret = np.asarray(x % y)
-    return ret
+    return np.asarray(np.mod(x, y, out=out))
+
+
+floormod.support_native_out = True
 
 
 def unstack(x: np.ndarray, axis: int, keepdims: bool = False) -> List[np.ndarray]:
     if x.shape == ():
         return [x]
-    x_split = np.split(x, x.shape[axis], axis)
+    x_moved = np.moveaxis(x, axis, 0)
     if keepdims:
-        return x_split
-    return [np.squeeze(item, axis) for item in x_split]
+        return [np.expand_dims(item, axis) for item in x_moved]
+    return list(x_moved)
 
 
 def inplace_decrement(
     x: Union[ivy.Array, np.ndarray], val: Union[ivy.Array, np.ndarray]
 ) -> ivy.Array:
     (x_native, val_native), _ = ivy.args_to_native(x, val)
-    x_native -= val_native
+    np.subtract(x_native, val_native, out=x_native, casting="unsafe")
     if ivy.is_ivy_array(x):
         x.data = x_native
     else:
@@ -117,7 +125,7 @@ def inplace_increment(
     x: Union[ivy.Array, np.ndarray], val: Union[ivy.Array, np.ndarray]
 ) -> ivy.Array:
     (x_native, val_native), _ = ivy.args_to_native(x, val)
-    x_native += val_native
+    np.add(x_native, val_native, out=x_native, casting="unsafe")
     if ivy.is_ivy_array(x):
         x.data = x_native
     else:
@@ -158,16 +166,79 @@ def cumprod(
     if dtype is None:
         dtype = _infer_dtype(x.dtype)
     if exclusive:
-        x = np.swapaxes(x, axis, -1)
-        x = np.concatenate((np.ones_like(x[..., -1:]), x[..., :-1]), -1)
-        res = np.cumprod(x, -1, dtype=dtype)
-        res = np.swapaxes(res, axis, -1)
+        x = np.moveaxis(x, axis, -1)
+        native_out = (
+            out is not None and out.dtype == dtype and not np.may_share_memory(out, x)
+        )
+        if native_out:
+            # scan straight into the output buffer
+            res = np.moveaxis(out, axis, -1)
+        else:
+            res = np.empty_like(x, dtype=dtype)
+        res[..., :1] = 1
+        np.cumprod(x[..., :-1], -1, dtype=dtype, out=res[..., 1:])
+        if native_out:
+            return out
+        res = np.moveaxis(res, -1, axis)
         if out is not None:
-            return ivy.inplace_update(out, res)
+            # cast into out, as np.cumprod does in the non-exclusive case
+            np.copyto(out, res, casting="unsafe")
+            return out
         return res
     return np.cumprod(x, axis, dtype=dtype, out=out)
 
 
+cumprod.support_native_out = True
+
+
+def _scatter_flat_bincount(
+    indices: np.ndarray, updates: np.ndarray, size: int
+) -> Optional[np.ndarray]:
+    # np.bincount sums in float64, so only use it for float updates, otherwise
+    # return None and let the caller fall back to np.add.at
+    if updates.ndim != 1 or indices.shape != updates.shape:
+        return None
+    if updates.dtype.kind != "f":
+        return None
+    try:
+        res = np.bincount(indices, weights=updates, minlength=size)
+    except (TypeError, ValueError):
+        # unsigned 64-bit or negative indices
+        return None
+    if res.shape[0] != size:
+        # out of bounds indices, np.add.at raises the appropriate error
+        return None
+    return res.astype(updates.dtype, copy=False)
+
+
+def _scatter_min_max(
+    indices: Union[np.ndarray, tuple],
+    updates: np.ndarray,
+    shape: Sequence[int],
+    reduction: str,
+    target: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    ufunc = np.minimum if reduction == "min" else np.maximum
+    if target is not None:
+        ufunc.at(target, indices, updates)
+        return target
+    dtype = updates.dtype
+    if dtype.kind == "f":
+        init_val = np.inf if reduction == "min" else -np.inf
+    elif dtype.kind in "iu":
+        init_val = np.iinfo(dtype).max if reduction == "min" else np.iinfo(dtype).min
+    else:
+        init_val = reduction == "min"
+    target = np.full(shape, init_val, dtype=dtype)
+    ufunc.at(target, indices, updates)
+    # cells which received no update are zeroed using a mask of the written
+    # indices, rather than by comparing the result against the initial value
+    untouched = np.ones(shape, dtype=bool)
+    untouched[indices] = False
+    target[untouched] = 0
+    return target
+
+
 def scatter_flat(
     indices: np.ndarray,
     updates: np.ndarray,
@@ -181,31 +252,32 @@ def scatter_flat(
     if ivy.exists(size) and ivy.exists(target):
         assert len(target.shape) == 1 and target.shape[0] == size
     if reduction == "sum":
-        if not target_given:
-            target = np.zeros([size], dtype=updates.dtype)
-        np.add.at(target, indices, updates)
+        res = (
+            None
+            if target_given and target.dtype != updates.dtype
+            else _scatter_flat_bincount(
+                indices, updates, target.shape[0] if target_given else size
+            )
+        )
+        if res is None:
+            if not target_given:
+                target = np.zeros([size], dtype=updates.dtype)
+            np.add.at(target, indices, updates)
+        elif target_given:
+            target += res
+        else:
+            target = res
     elif reduction == "replace":
-        if not target_given:
+        if target_given:
+            target = np.asarray(target).copy()
+            target.setflags(write=1)
+        else:
             target = np.zeros([size], dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
         target[indices] = updates
-    elif reduction == "min":
-        if not target_given:
-            target = np.ones([size], dtype=updates.dtype) * 1e12
-        np.minimum.at(target, indices, updates)
-        if not target_given:
-            target = np.asarray(
-                np.where(target == 1e12, 0.0, target), dtype=updates.dtype
-            )
-    elif reduction == "max":
-        if not target_given:
-            target = np.ones([size], dtype=updates.dtype) * -1e12
-        np.maximum.at(target, indices, updates)
-        if not target_given:
-            target = np.asarray(
-                np.where(target == -1e12, 0.0, target), dtype=updates.dtype
-            )
+    elif reduction in ["min", "max"]:
+        target = _scatter_min_max(
+            indices, updates, [size], reduction, target if target_given else None
+        )
     else:
         raise Exception(
             'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
@@ -236,25 +308,16 @@ def scatter_nd(
             target = np.zeros(shape, dtype=updates.dtype)
         np.add.at(target, indices_tuple, updates)
     elif reduction == "replace":
-        if not target_given:
+        if target_given:
+            target = np.asarray(target).copy()
+            target.setflags(write=1)
+        else:
             target = np.zeros(shape, dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
         target[indices_tuple] = updates
-    elif reduction == "min":
-        if not target_given:
-            target = np.ones(shape) * 1e12
-        np.minimum.at(target, indices_tuple, updates)
-        if not target_given:
-            target = np.where(target == 1e12, 0, target)
-            target = np.asarray(target, dtype=updates.dtype)
-    elif reduction == "max":
-        if not target_given:
-            target = np.ones(shape, dtype=updates.dtype) * -1e12
-        np.maximum.at(target, indices_tuple, updates)
-        if not target_given:
-            target = np.where(target == -1e12, 0.0, target)
-            target = np.asarray(target, dtype=updates.dtype)
+    elif reduction in ["min", "max"]:
+        target = _scatter_min_max(
+            indices_tuple, updates, shape, reduction, target if target_given else None
+        )
     else:
         raise Exception(
             'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
@@ -276,36 +339,32 @@ def gather(
     *,
     out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    return _to_device(np.take_along_axis(params, indices, axis))
+    if params.ndim == 1 and indices.ndim == 1 and axis in [-1, 0]:
+        # take_along_axis reduces to a plain take here, without the per-call
+        # broadcasting of indices against params
+        if out is None or out.dtype == params.dtype:
+            return _to_device(np.take(params, indices, out=out))
+        res = _to_device(np.take(params, indices))
+    else:
+        res = _to_device(np.take_along_axis(params, indices, axis))
+    if ivy.exists(out):
+        return ivy.inplace_update(out, res)
+    return res
+
+
+gather.support_native_out = True
 
 
 def gather_nd(
     params: np.ndarray, indices: np.ndarray, *, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    indices_shape = indices.shape
-    params_shape = params.shape
-    num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
-    result_dim_sizes = np.array(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
-    flat_params = np.reshape(params, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = np.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = np.tile(
-        np.reshape(np.sum(indices * indices_scales, -1, keepdims=True), (-1, 1)),
-        (1, implicit_indices_factor),
-    )
-    implicit_indices = np.tile(
-        np.expand_dims(np.arange(implicit_indices_factor), 0),
-        (indices_for_flat_tiled.shape[0], 1),
-    )
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = np.reshape(indices_for_flat, (-1,)).astype(np.int32)
-    flat_gather = np.take(flat_params, flat_indices_for_flat, 0)
-    new_shape = list(indices_shape[:-1]) + list(params_shape[num_index_dims:])
-    res = np.reshape(flat_gather, new_shape)
+    if indices.shape[-1] == 0:
+        # an empty index selects the whole of params for every index
+        res = np.broadcast_to(params, indices.shape[:-1] + params.shape).copy()
+        return _to_device(res)
+    # indexing with one array per leading dim lets numpy compute the strided
+    # offsets in a single pass, without flattening (and possibly copying) params
+    res = params[tuple(np.moveaxis(indices, -1, 0))]
     return _to_device(res)
 
 
@@ -315,12 +374,15 @@ def multiprocessing(context=None):
     )
 
 
-def indices_where(x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
-    where_x = np.where(x)
-    if len(where_x) == 1:
-        return np.expand_dims(where_x[0], -1)
-    res = np.concatenate([np.expand_dims(item, -1) for item in where_x], -1, out=out)
-    return res
+def indices_where(
+    x: np.ndarray, *, as_tuple: bool = False, out: Optional[np.ndarray] = None
+) -> Union[np.ndarray, Tuple[np.ndarray]]:
+    where_x = np.nonzero(x)
+    if as_tuple:
+        return where_x
+    if len(where_x) == 1 and out is None:
+        return where_x[0][:, None]
+    return np.stack(where_x, -1, out=out)
 
 
 indices_where.support_native_out = True
@@ -328,22 +390,28 @@ indices_where.support_native_out = True
 
 # noinspection PyUnusedLocal
 def one_hot(
-    indices: np.ndarray, depth: int, *, device: str, out: Optional[np.ndarray] = None
+    indices: np.ndarray,
+    depth: int,
+    *,
+    dtype: Optional[np.dtype] = None,
+    device: str,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    # from https://stackoverflow.com/questions/38592324/one-hot-encoding-using-numpy
-    res = np.eye(depth)[np.array(indices).reshape(-1)]
+    flat_indices = np.asarray(indices).reshape(-1)
+    res = np.zeros((flat_indices.size, depth), dtype=as_native_dtype(dtype))
+    res[np.arange(flat_indices.size), flat_indices] = 1
     return res.reshape(list(indices.shape) + [depth])
 
 
 def shape(x: np.ndarray, as_array: bool = False) -> Union[ivy.Shape, ivy.Array]:
     if as_array:
-        return ivy.array(np.shape(x))
+        return ivy.array(x.shape)
     else:
         return ivy.Shape(x.shape)
 
 
 def get_num_dims(x, as_tensor=False):
-    return np.asarray(len(np.shape(x))) if as_tensor else len(x.shape)
+    return np.asarray(x.ndim) if as_tensor else x.ndim
 
 
 def current_backend_str():
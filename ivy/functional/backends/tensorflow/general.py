@@ -3,7 +3,7 @@ signature.
 """
 
 # global
-from typing import Optional, Union, Sequence, List
+from typing import Optional, Union, Sequence, List, Tuple
 
 
 _round = round
@@ -14,6 +14,7 @@ import tensorflow as tf
 
 # local
 import ivy
+from ivy.functional.backends.tensorflow.data_type import as_native_dtype
 
 
 def is_native_array(x, exclusive=False):
@@ -425,9 +426,13 @@ def one_hot(
     indices: Union[tf.Tensor, tf.Variable],
     depth: int,
     *,
+    dtype: Optional[tf.DType] = None,
     device: str,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
+    dtype = as_native_dtype(dtype)
+    # the default on and off values of 1 and 0 cannot be converted to bool
+    on_off = (True, False) if dtype == tf.bool else (None, None)
     if indices.dtype == tf.int8:
         indices = tf.cast(indices, tf.uint8)
     elif indices.dtype == tf.int16 or tf.uint16:
@@ -437,8 +442,8 @@ def one_hot(
     device = ivy.default_device(device)
     if device is not None:
         with tf.device(ivy.as_native_dev(device)):
-            return tf.one_hot(indices, depth)
-    return tf.one_hot(indices, depth)
+            return tf.one_hot(indices, depth, *on_off, dtype=dtype)
+    return tf.one_hot(indices, depth, *on_off, dtype=dtype)
 
 
 one_hot.unsupported_dtypes = ("int8", "int16", "uint16", "uint32", "uint64")
@@ -457,9 +462,12 @@ def multiprocessing(context=None):
 def indices_where(
     x: Union[tf.Tensor, tf.Variable],
     *,
+    as_tuple: bool = False,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
-) -> Union[tf.Tensor, tf.Variable]:
+) -> Union[tf.Tensor, tf.Variable, Tuple[tf.Tensor]]:
     where_x = tf.experimental.numpy.where(x)
+    if as_tuple:
+        return tuple(where_x)
     if len(where_x) == 1:
         return tf.expand_dims(where_x[0], -1)
     res = tf.experimental.numpy.concatenate(
@@ -6,9 +6,12 @@ import numpy as np
 import torch
 from operator import mul
 from functools import reduce
-from typing import List, Optional, Union, Sequence
+from itertools import accumulate
+from typing import List, Optional, Union, Sequence, Tuple
 from numbers import Number
 
+# local
+from ivy.functional.backends.torch.data_type import as_native_dtype
 
 torch_scatter = None
 
@@ -334,11 +337,9 @@ def scatter_nd(
     dtype = updates.dtype
     indices_shape = indices.shape
     num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        reduce(mul, shape[i + 1 :], 1) for i in range(len(shape) - 1)
-    ] + [1]
+    result_dim_sizes_list = list(accumulate(shape[:0:-1], mul, initial=1))[::-1]
     result_dim_sizes = torch.tensor(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
+    implicit_indices_factor = result_dim_sizes_list[num_index_dims - 1]
     flat_result_size = reduce(mul, shape, 1)
     if reduction in ["sum", "replace"]:
         initial_val = torch.tensor(0).type(dtype)
@@ -424,11 +425,9 @@ def gather_nd(
     indices_shape = indices.shape
     params_shape = params.shape
     num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
+    result_dim_sizes_list = list(accumulate(params_shape[:0:-1], mul, initial=1))[::-1]
     result_dim_sizes = torch.tensor(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
+    implicit_indices_factor = result_dim_sizes_list[num_index_dims - 1]
     flat_params = torch.reshape(params, (-1,))
     new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
     indices_scales = torch.reshape(result_dim_sizes[0:num_index_dims], new_shape)
@@ -456,9 +455,11 @@ def multiprocessing(context=None):
 
 
 def indices_where(
-    x: torch.Tensor, *, out: Optional[torch.Tensor] = None
-) -> torch.Tensor:
+    x: torch.Tensor, *, as_tuple: bool = False, out: Optional[torch.Tensor] = None
+) -> Union[torch.Tensor, Tuple[torch.Tensor]]:
     where_x = torch.where(x)
+    if as_tuple:
+        return where_x
     res = torch.cat([torch.unsqueeze(item, -1) for item in where_x], -1, out=out)
     return res
 
@@ -471,10 +472,13 @@ def one_hot(
     indices: torch.Tensor,
     depth: int,
     *,
+    dtype: Optional[torch.dtype] = None,
     device: torch.device,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
-    return torch.nn.functional.one_hot(indices.type(torch.int64), depth).to(device)
+    return torch.nn.functional.one_hot(indices.type(torch.int64), depth).to(
+        device=device, dtype=as_native_dtype(dtype)
+    )
 
 
 def shape(x: torch.Tensor, as_array: bool = False) -> Union[ivy.Shape, ivy.Array]:
@@ -3370,25 +3370,33 @@ def multiprocessing(context: str = None):
 def indices_where(
     x: Union[ivy.Array, ivy.NativeArray],
     *,
+    as_tuple: bool = False,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
-) -> Union[ivy.Array, ivy.NativeArray]:
+) -> Union[ivy.Array, ivy.NativeArray, Tuple[Union[ivy.Array, ivy.NativeArray]]]:
     """Returns indices or true elements in an input boolean array.
 
     Parameters
     ----------
     x
         Boolean array, for which indices are desired.
+    as_tuple
+        Whether to return a tuple with one index array per dimension of x, which can
+        be used to directly index an array, rather than a single stacked array.
+        Default is False.
     out
         optional output array, for writing the result to. It must have a shape that the
-        inputs broadcast to.
+        inputs broadcast to. Cannot be used together with as_tuple.
 
     Returns
     -------
     ret
-        Indices for where the boolean array is True.
+        Indices for where the boolean array is True, either as an array of shape
+        [num_true, num_dims] or as a tuple of num_dims arrays of shape [num_true].
 
     """
-    return current_backend(x).indices_where(x, out=out)
+    if as_tuple and ivy.exists(out):
+        raise Exception("indices_where does not support out when as_tuple is True")
+    return current_backend(x).indices_where(x, as_tuple=as_tuple, out=out)
 
 
 @to_native_arrays_and_back
@@ -3399,6 +3407,7 @@ def one_hot(
     indices: Union[ivy.Array, ivy.NativeArray],
     depth: int,
     *,
+    dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
     device: Union[ivy.Device, ivy.NativeDevice] = None,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
@@ -3410,6 +3419,10 @@ def one_hot(
         Indices for where the ones should be scattered *[batch_shape, dim]*
     depth
         Scalar defining the depth of the one-hot dimension.
+    dtype
+        data type of the output array. Small integer or boolean types such as
+        "uint8" or "bool" reduce the memory of the result. If None, the default
+        one-hot data type of the backend is used. Default is None.
     device
         device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc. Same as x if
         None.
@@ -3424,7 +3437,9 @@ def one_hot(
         overrides.
 
     """
-    return current_backend(indices).one_hot(indices, depth, device=device, out=out)
+    return current_backend(indices).one_hot(
+        indices, depth, dtype=dtype, device=device, out=out
+    )
 
 
 @to_native_arrays_and_back
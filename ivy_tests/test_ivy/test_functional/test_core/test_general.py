@@ -471,6 +471,17 @@ def test_floormod(
     )
 
 
+@handle_cmd_line_args
+def test_floormod_0d(device):
+    ret = ivy.floormod(ivy.array(7, device=device), ivy.array(3, device=device))
+    # type test
+    assert ivy.is_ivy_array(ret)
+    # cardinality test
+    assert ret.shape == ()
+    # value test
+    assert ivy.to_scalar(ret) == 1
+
+
 # unstack
 @handle_cmd_line_args
 @given(
@@ -561,15 +572,17 @@ def test_unstack(
 # indices_where
 @given(
     x=helpers.dtype_and_values(available_dtypes=(ivy_np.bool,)),
+    as_tuple=st.booleans(),
     with_out=st.booleans(),
     as_variable=st.booleans(),
-    num_positional_args=st.integers(0, 3),
+    num_positional_args=helpers.num_positional_args(fn_name="indices_where"),
     native_array=st.booleans(),
     container=st.booleans(),
     instance_method=st.booleans(),
 )
 def test_indices_where(
     x,
+    as_tuple,
     with_out,
     as_variable,
     num_positional_args,
@@ -591,6 +604,7 @@ def test_indices_where(
         fw=fw,
         fn_name="indices_where",
         x=np.asarray(x, dtype=dtype),
+        as_tuple=as_tuple,
     )
 
 
@@ -601,11 +615,13 @@ def test_indices_where(
     x=helpers.dtype_and_values(
         available_dtypes=ivy_np.valid_int_dtypes, min_value=1, max_value=10000
     ),
-    num_positional_args=st.integers(0, 3),
+    out_dtype=st.sampled_from([None, "bool", "uint8", "float32"]),
+    num_positional_args=helpers.num_positional_args(fn_name="one_hot"),
 )
 def test_one_hot(
     depth,
     x,
+    out_dtype,
     with_out,
     as_variable,
     num_positional_args,
@@ -630,6 +646,7 @@ def test_one_hot(
         fn_name="one_hot",
         indices=np.asarray(x, dtype=dtype),
         depth=depth,
+        dtype=out_dtype,
     )
 
 
@@ -839,6 +856,30 @@ def test_scatter_nd(
     )
 
 
+# scatter_flat and scatter_nd min/max reductions
+@pytest.mark.parametrize(
+    ("reduction", "updates", "dtype", "expected"),
+    [
+        ("min", [True, True, True, False], "bool", [True, False, False, False]),
+        ("max", [True, True, True, False], "bool", [True, False, True, False]),
+        ("min", [1e12, 2e12, -1e12, -2e12], "float64", [1e12, 0.0, -2e12, 0.0]),
+        ("max", [1e12, 2e12, -1e12, -2e12], "float64", [2e12, 0.0, -1e12, 0.0]),
+    ],
+)
+def test_scatter_min_max(reduction, updates, dtype, expected, device):
+    if ivy.current_backend_str() != "numpy":
+        # only the numpy backend supports boolean min/max scatters
+        pytest.skip()
+    indices = ivy.array([0, 0, 2, 2], device=device)
+    updates = ivy.array(updates, dtype=dtype, device=device)
+    ret = ivy.scatter_flat(indices, updates, 4, reduction)
+    assert ivy.dtype(ret) == dtype
+    assert ivy.to_numpy(ret).tolist() == expected
+    ret = ivy.scatter_nd(ivy.expand_dims(indices, -1), updates, [4], reduction)
+    assert ivy.dtype(ret) == dtype
+    assert ivy.to_numpy(ret).tolist() == expected
+
+
 # gather
 # @given(
 #     params_n_indices_n_axis=helpers.array_and_indices_and_axis(
@@ -877,6 +918,26 @@ def test_scatter_nd(
 #     )
 
 
+# gather with 1-d params and indices
+@pytest.mark.parametrize("out_dtype", [None, "float32", "float64"])
+def test_gather_1d(out_dtype, device):
+    if ivy.current_backend_str() != "numpy":
+        # the plain take fast path is specific to the numpy backend
+        pytest.skip()
+    params = ivy.array([1.0, 2.0, 3.0, 4.0], dtype="float32", device=device)
+    indices = ivy.array([3, 0, 0, 2], device=device)
+    out = None
+    if out_dtype is not None:
+        out = ivy.zeros([4], dtype=out_dtype, device=device)
+    ret = ivy.gather(params, indices, out=out)
+    # type test
+    assert ivy.is_ivy_array(ret)
+    if out is not None:
+        assert ret is out
+    # value test
+    assert ivy.to_numpy(ret).tolist() == [4.0, 1.0, 1.0, 3.0]
+
+
 # gather_nd
 # @given(
 #     params_n_ndindices=helpers.array_and_ndindices(